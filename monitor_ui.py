@@ -5,18 +5,35 @@ Real-time System Monitor UI
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.figure import Figure
+import numpy as np
+import queue
 import threading
 import time
+import math
+import traceback
 from datetime import datetime
-from system_monitor import SystemMonitor, format_bytes
+from system_monitor import SystemMonitor, format_bytes, decimate
+from pdf_report import PDFReportGenerator
 
 
 class MonitorUI:
     """실시간 모니터링 UI 클래스"""
 
+    # 정보 레이블 포맷 템플릿 (스냅샷마다 % 연산자로 채움)
+    CPU_FMT = "CPU: %.1f%%"
+    CPU_FREQ_FMT = "주파수: %.0f MHz"
+    CPU_COUNT_FMT = "코어: %s"
+    MEM_FMT = "메모리: %.1f%%"
+    USED_FMT = "사용: %s / %s"
+    SWAP_FMT = "스왑: %.1f%%"
+    DISK_FMT = "디스크: %.1f%%"
+    DISK_IO_FMT = "읽기/쓰기: %s/s / %s/s"
+    NET_SPEED_FMT = "송신/수신: %s/s / %s/s"
+    TEMP_FMT = "온도: %.1f °C"
+    GPU_FMT = "GPU: %.1f%% | 온도: %.1f°C"
+
     def __init__(self, root):
         self.root = root
         self.root.title("시스템 리소스 모니터")
@@ -24,13 +41,38 @@ class MonitorUI:
 
         self.monitor = SystemMonitor()
         self.is_monitoring = False
-        self.monitoring_thread = None
-        self.recording_start_time = None
+        self.monitoring_tick_id = None
+        self.recording_start_ns = None  # time.time_ns(), 히스토리 타임스탬프와 같은 기준
         self.recording_duration = 60  # 1분
 
+        # 다시 그리기 제어: 새 데이터가 있을 때만, 최대 5Hz로 그림
+        self._dirty = False
+        self._last_draw = 0
+        self._pending_snapshot = None
+        # 마지막으로 알린 수집 오류 (같은 오류가 반복되면 다시 알리지 않음)
+        self._last_collect_error = None
+
+        # 대기 중 그래프의 X축(샘플 번호), 길이가 바뀔 때만 다시 생성
+        self._times_cache = np.empty(0, dtype=np.float64)
+
+        # 레이블 변수별 마지막 표시 문자열 (같은 값이면 Tk 호출 생략)
+        self._label_cache = {}
+
+        # 스냅샷은 수집 스레드에서만 수집하고, Tk 위젯은 메인 스레드에서만 갱신
+        self._queue = queue.Queue()
+        self._wake = threading.Event()
+        self._running = True
+
         # UI 구성
         self.setup_ui()
 
+        # 창을 닫을 때 수집 스레드와 모니터 자원(nvidia-smi 프로세스 등) 정리
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+
+        self.collector_thread = threading.Thread(target=self.collector_loop)
+        self.collector_thread.daemon = True
+        self.collector_thread.start()
+
         # 업데이트 시작
         self.update_display()
 
@@ -80,31 +122,40 @@ class MonitorUI:
         # CPU 정보
         cpu_frame = ttk.LabelFrame(info_frame, text="CPU 정보", padding="10")
         cpu_frame.pack(fill=tk.X, pady=5)
-        self.cpu_label = ttk.Label(cpu_frame, text="CPU: --%", font=("Arial", 12))
+        self.cpu_var = tk.StringVar(self.root, value="CPU: --%")
+        self.cpu_label = ttk.Label(cpu_frame, textvariable=self.cpu_var, font=("Arial", 12))
         self.cpu_label.pack(anchor=tk.W)
-        self.cpu_freq_label = ttk.Label(cpu_frame, text="주파수: -- MHz")
+        self.cpu_freq_var = tk.StringVar(self.root, value="주파수: -- MHz")
+        self.cpu_freq_label = ttk.Label(cpu_frame, textvariable=self.cpu_freq_var)
         self.cpu_freq_label.pack(anchor=tk.W)
-        self.cpu_count_label = ttk.Label(cpu_frame, text="코어: --")
+        self.cpu_count_var = tk.StringVar(self.root, value="코어: --")
+        self.cpu_count_label = ttk.Label(cpu_frame, textvariable=self.cpu_count_var)
         self.cpu_count_label.pack(anchor=tk.W)
 
         # 메모리 정보
         mem_frame = ttk.LabelFrame(info_frame, text="메모리 정보", padding="10")
         mem_frame.pack(fill=tk.X, pady=5)
-        self.mem_label = ttk.Label(mem_frame, text="메모리: --%", font=("Arial", 12))
+        self.mem_var = tk.StringVar(self.root, value="메모리: --%")
+        self.mem_label = ttk.Label(mem_frame, textvariable=self.mem_var, font=("Arial", 12))
         self.mem_label.pack(anchor=tk.W)
-        self.mem_used_label = ttk.Label(mem_frame, text="사용: -- / --")
+        self.mem_used_var = tk.StringVar(self.root, value="사용: -- / --")
+        self.mem_used_label = ttk.Label(mem_frame, textvariable=self.mem_used_var)
         self.mem_used_label.pack(anchor=tk.W)
-        self.swap_label = ttk.Label(mem_frame, text="스왑: --%")
+        self.swap_var = tk.StringVar(self.root, value="스왑: --%")
+        self.swap_label = ttk.Label(mem_frame, textvariable=self.swap_var)
         self.swap_label.pack(anchor=tk.W)
 
         # 디스크 정보
         disk_frame = ttk.LabelFrame(info_frame, text="디스크 정보", padding="10")
         disk_frame.pack(fill=tk.X, pady=5)
-        self.disk_label = ttk.Label(disk_frame, text="디스크: --%", font=("Arial", 12))
+        self.disk_var = tk.StringVar(self.root, value="디스크: --%")
+        self.disk_label = ttk.Label(disk_frame, textvariable=self.disk_var, font=("Arial", 12))
         self.disk_label.pack(anchor=tk.W)
-        self.disk_used_label = ttk.Label(disk_frame, text="사용: -- / --")
+        self.disk_used_var = tk.StringVar(self.root, value="사용: -- / --")
+        self.disk_used_label = ttk.Label(disk_frame, textvariable=self.disk_used_var)
         self.disk_used_label.pack(anchor=tk.W)
-        self.disk_io_label = ttk.Label(disk_frame, text="읽기/쓰기: -- / --")
+        self.disk_io_var = tk.StringVar(self.root, value="읽기/쓰기: -- / --")
+        self.disk_io_label = ttk.Label(disk_frame, textvariable=self.disk_io_var)
         self.disk_io_label.pack(anchor=tk.W)
 
         # 네트워크 정보
@@ -112,19 +163,22 @@ class MonitorUI:
         net_frame.pack(fill=tk.X, pady=5)
         self.net_label = ttk.Label(net_frame, text="네트워크", font=("Arial", 12))
         self.net_label.pack(anchor=tk.W)
-        self.net_speed_label = ttk.Label(net_frame, text="송신/수신: -- / --")
+        self.net_speed_var = tk.StringVar(self.root, value="송신/수신: -- / --")
+        self.net_speed_label = ttk.Label(net_frame, textvariable=self.net_speed_var)
         self.net_speed_label.pack(anchor=tk.W)
 
         # 온도 정보
         temp_frame = ttk.LabelFrame(info_frame, text="온도 정보", padding="10")
         temp_frame.pack(fill=tk.X, pady=5)
-        self.temp_label = ttk.Label(temp_frame, text="온도: -- °C")
+        self.temp_var = tk.StringVar(self.root, value="온도: -- °C")
+        self.temp_label = ttk.Label(temp_frame, textvariable=self.temp_var)
         self.temp_label.pack(anchor=tk.W)
 
         # GPU 정보
         gpu_frame = ttk.LabelFrame(info_frame, text="GPU 정보", padding="10")
         gpu_frame.pack(fill=tk.X, pady=5)
-        self.gpu_label = ttk.Label(gpu_frame, text="GPU: 사용 불가")
+        self.gpu_var = tk.StringVar(self.root, value="GPU: 사용 불가")
+        self.gpu_label = ttk.Label(gpu_frame, textvariable=self.gpu_var)
         self.gpu_label.pack(anchor=tk.W)
 
         # 그래프 프레임 (우측)
@@ -142,190 +196,319 @@ class MonitorUI:
         self.ax_net = self.fig.add_subplot(3, 2, 4)
         self.ax_temp = self.fig.add_subplot(3, 2, 5)
         self.ax_gpu = self.fig.add_subplot(3, 2, 6)
+        self._axes = [self.ax_cpu, self.ax_mem, self.ax_disk,
+                      self.ax_net, self.ax_temp, self.ax_gpu]
+
+        # 축 제목/레이블/눈금은 한 번만 설정하고, 이후에는 라인 데이터만 갱신
+        self.ax_cpu.set_title('CPU 사용률', fontsize=10, fontweight='bold')
+        self.ax_cpu.set_ylabel('사용률 (%)')
+        self.ax_cpu.set_ylim(0, 100)
+
+        self.ax_mem.set_title('메모리 사용률', fontsize=10, fontweight='bold')
+        self.ax_mem.set_ylabel('사용률 (%)')
+        self.ax_mem.set_ylim(0, 100)
+
+        self.ax_disk.set_title('디스크 I/O', fontsize=10, fontweight='bold')
+        self.ax_disk.set_ylabel('속도 (MB/s)')
+        self.ax_disk.set_ylim(0, 1)
+
+        self.ax_net.set_title('네트워크 트래픽', fontsize=10, fontweight='bold')
+        self.ax_net.set_ylabel('속도 (MB/s)')
+        self.ax_net.set_ylim(0, 1)
+
+        self.ax_temp.set_title('시스템 온도', fontsize=10, fontweight='bold')
+        self.ax_temp.set_ylabel('온도 (°C)')
+        self.ax_temp.set_ylim(0, 100)
+
+        self.ax_gpu.set_title('GPU 사용률', fontsize=10, fontweight='bold')
+        self.ax_gpu.set_ylabel('사용률 (%)')
+        self.ax_gpu.set_ylim(0, 100)
+
+        # X축 레이블 (하단 그래프만)
+        self.ax_temp.set_xlabel('시간 (초)')
+        self.ax_gpu.set_xlabel('시간 (초)')
+
+        for ax in self._axes:
+            ax.set_xlim(0, self.recording_duration)
+            ax.grid(True, alpha=0.3)
+
+        # 라인 아티스트 미리 생성 (animated=True: 배경 렌더링에서 제외하고 블리팅으로만 그림)
+        self.line_cpu, = self.ax_cpu.plot([], [], 'b-', linewidth=2, animated=True)
+        self.line_mem, = self.ax_mem.plot([], [], 'g-', linewidth=2, animated=True)
+        self.line_disk_read, = self.ax_disk.plot(
+            [], [], 'r-', label='읽기', linewidth=2, animated=True)
+        self.line_disk_write, = self.ax_disk.plot(
+            [], [], 'orange', label='쓰기', linewidth=2, animated=True)
+        self.line_net_sent, = self.ax_net.plot(
+            [], [], 'm-', label='송신', linewidth=2, animated=True)
+        self.line_net_recv, = self.ax_net.plot(
+            [], [], 'c-', label='수신', linewidth=2, animated=True)
+        self.line_temp, = self.ax_temp.plot([], [], 'orange', linewidth=2, animated=True)
+        self.line_gpu, = self.ax_gpu.plot([], [], 'purple', linewidth=2, animated=True)
+        self.ax_disk.legend(loc='upper right', fontsize=8)
+        self.ax_net.legend(loc='upper right', fontsize=8)
+
+        self._lines = {
+            self.ax_cpu: [self.line_cpu],
+            self.ax_mem: [self.line_mem],
+            self.ax_disk: [self.line_disk_read, self.line_disk_write],
+            self.ax_net: [self.line_net_sent, self.line_net_recv],
+            self.ax_temp: [self.line_temp],
+            self.ax_gpu: [self.line_gpu],
+        }
+
+        # 센서 사용 불가 안내 문구 (가용 여부가 바뀔 때만 전체 다시 그리기)
+        self.temp_na_text = self.ax_temp.text(
+            0.5, 0.5, '온도 센서\n사용 불가',
+            ha='center', va='center', transform=self.ax_temp.transAxes)
+        self.gpu_na_text = self.ax_gpu.text(
+            0.5, 0.5, 'GPU\n사용 불가',
+            ha='center', va='center', transform=self.ax_gpu.transAxes)
 
         # Canvas 생성
         self.canvas = FigureCanvasTkAgg(self.fig, master=graph_frame)
-        self.canvas.draw()
+        self._backgrounds = None
+        self.canvas.mpl_connect('draw_event', self._on_draw)
+        self.canvas.draw_idle()
         self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
 
+    def _on_draw(self, event):
+        """전체 다시 그리기(리사이즈, 축 범위 변경) 후 블리팅용 배경 캐시 갱신"""
+        self._backgrounds = {
+            ax: self.canvas.copy_from_bbox(ax.bbox) for ax in self._axes
+        }
+        for ax in self._axes:
+            for line in self._lines[ax]:
+                ax.draw_artist(line)
+
     def update_display(self):
         """디스플레이 업데이트"""
-        if not self.is_monitoring:
-            # 모니터링 중이 아니어도 현재 상태는 표시
-            snapshot = self.monitor.collect_snapshot()
-            self.update_info_labels(snapshot)
+        now = time.monotonic()
+
+        # 수집 스레드가 보낸 스냅샷 중 가장 최근 것만 사용 (수집 오류는 예외 객체로 전달됨)
+        snapshot = None
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if isinstance(item, Exception):
+                self.on_collect_error(item)
+            else:
+                snapshot = item
+        if snapshot is not None:
+            self._last_collect_error = None
+            self._mark_dirty(snapshot)
 
-        # 그래프 업데이트
-        self.update_graphs()
+        # 새 데이터가 있고 마지막으로 그린 지 200ms 이상 지났을 때만 다시 그림
+        if self._dirty and now - self._last_draw >= 0.2:
+            self.update_info_labels(self._pending_snapshot)
+            self.update_graphs()
+            self._dirty = False
+            self._last_draw = now
 
-        # 100ms마다 업데이트
-        self.root.after(100, self.update_display)
+        self.root.after(50, self.update_display)
+
+    def _mark_dirty(self, snapshot):
+        """새 스냅샷 도착 표시"""
+        self._pending_snapshot = snapshot
+        self._dirty = True
 
     def update_info_labels(self, snapshot):
         """정보 레이블 업데이트"""
         # CPU
         cpu = snapshot['cpu']
-        self.cpu_label.config(text=f"CPU: {cpu['percent']:.1f}%")
-        self.cpu_freq_label.config(text=f"주파수: {cpu['frequency']:.0f} MHz")
-        self.cpu_count_label.config(text=f"코어: {cpu['count']}")
+        self._set_text(self.cpu_var, self.CPU_FMT % cpu['percent'])
+        self._set_text(self.cpu_freq_var, self.CPU_FREQ_FMT % cpu['frequency'])
+        self._set_text(self.cpu_count_var, self.CPU_COUNT_FMT % cpu['count'])
 
         # 메모리
         mem = snapshot['memory']
-        self.mem_label.config(text=f"메모리: {mem['percent']:.1f}%")
-        self.mem_used_label.config(
-            text=f"사용: {format_bytes(mem['used'])} / {format_bytes(mem['total'])}"
+        self._set_text(self.mem_var, self.MEM_FMT % mem['percent'])
+        self._set_text(
+            self.mem_used_var,
+            self.USED_FMT % (format_bytes(mem['used']), format_bytes(mem['total']))
         )
-        self.swap_label.config(text=f"스왑: {mem['swap_percent']:.1f}%")
+        self._set_text(self.swap_var, self.SWAP_FMT % mem['swap_percent'])
 
         # 디스크
         disk = snapshot['disk']
-        self.disk_label.config(text=f"디스크: {disk['percent']:.1f}%")
-        self.disk_used_label.config(
-            text=f"사용: {format_bytes(disk['used'])} / {format_bytes(disk['total'])}"
+        self._set_text(self.disk_var, self.DISK_FMT % disk['percent'])
+        self._set_text(
+            self.disk_used_var,
+            self.USED_FMT % (format_bytes(disk['used']), format_bytes(disk['total']))
         )
-        self.disk_io_label.config(
-            text=f"읽기/쓰기: {format_bytes(disk['read_speed'])}/s / {format_bytes(disk['write_speed'])}/s"
+        self._set_text(
+            self.disk_io_var,
+            self.DISK_IO_FMT % (format_bytes(disk['read_speed']), format_bytes(disk['write_speed']))
         )
 
         # 네트워크
         net = snapshot['network']
-        self.net_speed_label.config(
-            text=f"송신/수신: {format_bytes(net['sent_speed'])}/s / {format_bytes(net['recv_speed'])}/s"
+        self._set_text(
+            self.net_speed_var,
+            self.NET_SPEED_FMT % (format_bytes(net['sent_speed']), format_bytes(net['recv_speed']))
         )
 
         # 온도
-        temps = snapshot['temperature']
-        if temps and 'error' not in temps:
-            temp_values = []
-            for name, values in temps.items():
-                if isinstance(values, list):
-                    temp_values.extend(values)
-            if temp_values:
-                avg_temp = sum(temp_values) / len(temp_values)
-                self.temp_label.config(text=f"온도: {avg_temp:.1f} °C")
-            else:
-                self.temp_label.config(text="온도: 사용 불가")
+        avg_temp = snapshot['temperature_avg']
+        if avg_temp is not None:
+            self._set_text(self.temp_var, self.TEMP_FMT % avg_temp)
         else:
-            self.temp_label.config(text="온도: 사용 불가")
+            self._set_text(self.temp_var, "온도: 사용 불가")
 
         # GPU
         gpu = snapshot['gpu']
         if gpu['available']:
-            self.gpu_label.config(
-                text=f"GPU: {gpu['usage']:.1f}% | 온도: {gpu['temperature']:.1f}°C"
+            self._set_text(
+                self.gpu_var,
+                self.GPU_FMT % (gpu['usage'], gpu['temperature'])
             )
         else:
-            self.gpu_label.config(text="GPU: 사용 불가")
+            self._set_text(self.gpu_var, "GPU: 사용 불가")
+
+    def _set_text(self, var, text):
+        """레이블에 연결된 StringVar를 값이 바뀐 경우에만 갱신"""
+        name = str(var)  # tk.Variable은 해시 불가이므로 Tcl 변수 이름을 키로 사용
+        if self._label_cache.get(name) == text:
+            return
+        self._label_cache[name] = text
+        var.set(text)
 
     def update_graphs(self):
         """그래프 업데이트"""
         history = self.monitor.get_history()
 
-        if not history['timestamps']:
+        if len(history['timestamps']) == 0:
             return
 
         # 시간축 (상대 시간으로 변환)
-        if self.recording_start_time:
-            times = [(t - self.recording_start_time).total_seconds()
-                    for t in history['timestamps']]
-        else:
-            times = list(range(len(history['timestamps'])))
-
-        # CPU 그래프
-        self.ax_cpu.clear()
-        self.ax_cpu.plot(times, history['cpu_percent'], 'b-', linewidth=2)
-        self.ax_cpu.set_title('CPU 사용률', fontsize=10, fontweight='bold')
-        self.ax_cpu.set_ylabel('사용률 (%)')
-        self.ax_cpu.set_ylim(0, 100)
-        self.ax_cpu.grid(True, alpha=0.3)
-
-        # 메모리 그래프
-        self.ax_mem.clear()
-        self.ax_mem.plot(times, history['memory_percent'], 'g-', linewidth=2)
-        self.ax_mem.set_title('메모리 사용률', fontsize=10, fontweight='bold')
-        self.ax_mem.set_ylabel('사용률 (%)')
-        self.ax_mem.set_ylim(0, 100)
-        self.ax_mem.grid(True, alpha=0.3)
-
-        # 디스크 I/O 그래프
-        self.ax_disk.clear()
-        disk_read_mb = [x / (1024 * 1024) for x in history['disk_read']]
-        disk_write_mb = [x / (1024 * 1024) for x in history['disk_write']]
-        self.ax_disk.plot(times, disk_read_mb, 'r-', label='읽기', linewidth=2)
-        self.ax_disk.plot(times, disk_write_mb, 'orange', label='쓰기', linewidth=2)
-        self.ax_disk.set_title('디스크 I/O', fontsize=10, fontweight='bold')
-        self.ax_disk.set_ylabel('속도 (MB/s)')
-        self.ax_disk.legend(loc='upper right', fontsize=8)
-        self.ax_disk.grid(True, alpha=0.3)
-
-        # 네트워크 그래프
-        self.ax_net.clear()
-        net_sent_mb = [x / (1024 * 1024) for x in history['net_sent']]
-        net_recv_mb = [x / (1024 * 1024) for x in history['net_recv']]
-        self.ax_net.plot(times, net_sent_mb, 'm-', label='송신', linewidth=2)
-        self.ax_net.plot(times, net_recv_mb, 'c-', label='수신', linewidth=2)
-        self.ax_net.set_title('네트워크 트래픽', fontsize=10, fontweight='bold')
-        self.ax_net.set_ylabel('속도 (MB/s)')
-        self.ax_net.legend(loc='upper right', fontsize=8)
-        self.ax_net.grid(True, alpha=0.3)
-
-        # 온도 그래프
-        self.ax_temp.clear()
-        if any(t > 0 for t in history['temperatures']):
-            self.ax_temp.plot(times, history['temperatures'], 'orange', linewidth=2)
-            self.ax_temp.set_title('시스템 온도', fontsize=10, fontweight='bold')
-            self.ax_temp.set_ylabel('온도 (°C)')
-        else:
-            self.ax_temp.text(0.5, 0.5, '온도 센서\n사용 불가',
-                            ha='center', va='center', transform=self.ax_temp.transAxes)
-            self.ax_temp.set_title('시스템 온도', fontsize=10, fontweight='bold')
-        self.ax_temp.grid(True, alpha=0.3)
-
-        # GPU 그래프
-        self.ax_gpu.clear()
-        if any(g > 0 for g in history['gpu_usage']):
-            self.ax_gpu.plot(times, history['gpu_usage'], 'purple', linewidth=2)
-            self.ax_gpu.set_title('GPU 사용률', fontsize=10, fontweight='bold')
-            self.ax_gpu.set_ylabel('사용률 (%)')
-            self.ax_gpu.set_ylim(0, 100)
+        if self.recording_start_ns:
+            times = (history['timestamps'] - self.recording_start_ns) * 1e-9
         else:
-            self.ax_gpu.text(0.5, 0.5, 'GPU\n사용 불가',
-                           ha='center', va='center', transform=self.ax_gpu.transAxes)
-            self.ax_gpu.set_title('GPU 사용률', fontsize=10, fontweight='bold')
-        self.ax_gpu.grid(True, alpha=0.3)
-
-        # X축 레이블 (하단 그래프만)
-        self.ax_temp.set_xlabel('시간 (초)')
-        self.ax_gpu.set_xlabel('시간 (초)')
-
-        self.canvas.draw()
-
-    def monitoring_loop(self):
-        """모니터링 루프"""
-        while self.is_monitoring:
-            snapshot = self.monitor.collect_snapshot()
-            self.update_info_labels(snapshot)
-
-            # 60초 경과 확인
-            elapsed = (datetime.now() - self.recording_start_time).total_seconds()
-            remaining = self.recording_duration - elapsed
+            n = len(history['timestamps'])
+            if len(self._times_cache) != n:
+                self._times_cache = np.arange(n, dtype=np.float64)
+            times = self._times_cache
+
+        # 그래프 폭보다 샘플이 많으면 줄여서 그림 (축 범위는 전체 데이터 기준)
+        (plot_times, cpu, mem, disk_read, disk_write,
+         net_sent, net_recv, temp, gpu) = decimate(
+            times, history['cpu_percent'], history['memory_percent'],
+            history['disk_read_mb'], history['disk_write_mb'],
+            history['net_sent_mb'], history['net_recv_mb'],
+            history['temperatures'], history['gpu_usage'])
+
+        self.line_cpu.set_data(plot_times, cpu)
+        self.line_mem.set_data(plot_times, mem)
+        self.line_disk_read.set_data(plot_times, disk_read)
+        self.line_disk_write.set_data(plot_times, disk_write)
+        self.line_net_sent.set_data(plot_times, net_sent)
+        self.line_net_recv.set_data(plot_times, net_recv)
+        self.line_temp.set_data(plot_times, temp)
+        self.line_gpu.set_data(plot_times, gpu)
+
+        # 축 범위나 센서 가용 여부가 바뀐 경우에만 전체 다시 그리기
+        needs_redraw = self._backgrounds is None
+        needs_redraw |= self._fit_xlim(times[-1])
+        needs_redraw |= self._fit_ylim(self.ax_disk, max(history['disk_read_mb'].max(), history['disk_write_mb'].max()))
+        needs_redraw |= self._fit_ylim(self.ax_net, max(history['net_sent_mb'].max(), history['net_recv_mb'].max()))
+        needs_redraw |= self._fit_ylim(self.ax_temp, history['temperatures'].max())
+        needs_redraw |= self._set_available(
+            self.line_temp, self.temp_na_text, bool((history['temperatures'] > 0).any()))
+        needs_redraw |= self._set_available(
+            self.line_gpu, self.gpu_na_text, bool((history['gpu_usage'] > 0).any()))
+
+        if needs_redraw:
+            # 유휴 시점에 한 번만 전체 다시 그리기 (draw_event -> _on_draw에서 배경 캐시와 라인 갱신)
+            # 그 전까지는 이전 배경으로 블리팅하지 않도록 캐시를 비움
+            self._backgrounds = None
+            self.canvas.draw_idle()
+            return
 
-            if remaining <= 0:
-                self.is_monitoring = False
-                self.root.after(0, self.on_monitoring_complete)
-                break
+        for ax in self._axes:
+            self.canvas.restore_region(self._backgrounds[ax])
+            for line in self._lines[ax]:
+                ax.draw_artist(line)
+            self.canvas.blit(ax.bbox)
+
+    def _fit_xlim(self, last_time):
+        """X축 범위를 recording_duration 단위로 맞춤 (변경 시 True)"""
+        span = self.recording_duration * max(1, math.ceil(last_time / self.recording_duration))
+        if self.ax_cpu.get_xlim() == (0, span):
+            return False
+        for ax in self._axes:
+            ax.set_xlim(0, span)
+        return True
+
+    def _fit_ylim(self, ax, peak):
+        """데이터 최댓값에 맞춰 Y축 범위 조정 (변경 시 True)"""
+        top = ax.get_ylim()[1]
+        if top * 0.25 <= peak <= top:
+            return False
+        new_top = max(peak * 1.2, 1)
+        if new_top == top:
+            return False
+        ax.set_ylim(0, new_top)
+        return True
+
+    def _set_available(self, line, na_text, available):
+        """센서 가용 여부에 따라 라인/안내 문구 표시 전환 (변경 시 True)"""
+        if line.get_visible() == available and na_text.get_visible() != available:
+            return False
+        line.set_visible(available)
+        na_text.set_visible(not available)
+        return True
+
+    def collector_loop(self):
+        """스냅샷 수집 루프 (백그라운드 스레드, 모니터링 중 0.5초 / 대기 중 1초 간격)"""
+        while self._running:
+            try:
+                snapshot = self.monitor.collect_snapshot()
+            except Exception as e:
+                if not self._running:
+                    # 창을 닫는 중 (모니터 자원이 이미 해제됨)
+                    break
+                # 스레드를 죽이지 않고 오류를 UI에 알린 뒤 다음 주기에 다시 시도
+                traceback.print_exc()
+                self._queue.put(e)
+            else:
+                self._queue.put(snapshot)
+
+            self._wake.wait(0.5 if self.is_monitoring else 1.0)
+            self._wake.clear()
+
+    def on_collect_error(self, error):
+        """수집 스레드 오류 표시 (메인 스레드, 같은 오류는 한 번만 대화상자로 알림)"""
+        message = f"{type(error).__name__}: {error}"
+        self.status_label.config(text=f"데이터 수집 오류: {message}")
+        if message != self._last_collect_error:
+            self._last_collect_error = message
+            messagebox.showerror("수집 오류", f"시스템 정보 수집 중 오류 발생:\n{message}")
+
+    def monitoring_tick(self):
+        """모니터링 경과 시간 확인 (Tk after로 0.5초마다 호출)"""
+        # 60초 경과 확인
+        elapsed = (time.time_ns() - self.recording_start_ns) * 1e-9
+        remaining = self.recording_duration - elapsed
+
+        if remaining <= 0:
+            self.monitoring_tick_id = None
+            self.is_monitoring = False
+            self.on_monitoring_complete()
+            return
 
-            self.status_label.config(
-                text=f"모니터링 중... 남은 시간: {int(remaining)}초"
-            )
+        self.status_label.config(
+            text=f"모니터링 중... 남은 시간: {int(remaining)}초"
+        )
 
-            time.sleep(0.5)
+        self.monitoring_tick_id = self.root.after(500, self.monitoring_tick)
 
     def start_monitoring(self):
         """모니터링 시작"""
         self.is_monitoring = True
         self.monitor.clear_history()
-        self.recording_start_time = datetime.now()
+        self.recording_start_ns = time.time_ns()
 
         self.start_button.config(state=tk.DISABLED)
         self.stop_button.config(state=tk.NORMAL)
@@ -333,12 +516,15 @@ class MonitorUI:
 
         self.status_label.config(text="모니터링 시작...")
 
-        self.monitoring_thread = threading.Thread(target=self.monitoring_loop)
-        self.monitoring_thread.daemon = True
-        self.monitoring_thread.start()
+        # 대기 중 간격으로 잠든 수집 스레드를 바로 깨움
+        self._wake.set()
+        self.monitoring_tick_id = self.root.after(500, self.monitoring_tick)
 
     def stop_monitoring(self):
         """모니터링 정지"""
+        if self.monitoring_tick_id is not None:
+            self.root.after_cancel(self.monitoring_tick_id)
+            self.monitoring_tick_id = None
         self.is_monitoring = False
         self.on_monitoring_complete()
 
@@ -353,8 +539,6 @@ class MonitorUI:
 
     def generate_pdf(self):
         """PDF 리포트 생성"""
-        from pdf_report import PDFReportGenerator
-
         try:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"system_monitor_report_{timestamp}.pdf"
@@ -368,6 +552,20 @@ class MonitorUI:
         except Exception as e:
             messagebox.showerror("오류", f"PDF 생성 중 오류 발생:\n{str(e)}")
 
+    def on_close(self):
+        """창 닫기 처리"""
+        if self.monitoring_tick_id is not None:
+            self.root.after_cancel(self.monitoring_tick_id)
+            self.monitoring_tick_id = None
+
+        # 수집 중인 스냅샷이 끝날 때까지 기다린 뒤 모니터 자원 해제
+        self._running = False
+        self._wake.set()
+        self.collector_thread.join(timeout=2)
+        self.monitor.close()
+
+        self.root.destroy()
+
 
 def main():
     """메인 함수"""
@@ -9,10 +9,223 @@ from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Image, Tabl
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.enums import TA_CENTER, TA_LEFT
 from reportlab.lib import colors
-import matplotlib.pyplot as plt
+import matplotlib
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import multiprocessing
+import os
 from datetime import datetime
 import io
-from system_monitor import format_bytes
+from system_monitor import format_bytes, decimate, ns_to_datetime, HISTORY_FIELDS
+
+
+# 사용자 matplotlibrc 설정과 관계없이 TeX 렌더링은 사용하지 않음
+matplotlib.rcParams['text.usetex'] = False
+
+
+def compute_stats(data):
+    """평균, 최소, 최대, 표준편차를 한 번에 계산"""
+    arr = np.asarray(data, dtype=np.float64)
+    std = arr.std(ddof=1) if arr.size > 1 else 0.0
+    return float(arr.mean()), float(arr.min()), float(arr.max()), float(std)
+
+
+def _padded_range(low, high, margin=0.05):
+    """최솟값/최댓값에 여백을 더한 축 범위 (matplotlib 자동 범위와 같은 5% 여백)"""
+    pad = (high - low) * margin or 1.0
+    return low - pad, high + pad
+
+
+class _ChartRenderer:
+    """행 단위로 재사용하는 그래프 Figure (프로세스당 1개)"""
+
+    def __init__(self):
+        # GUI 백엔드와 무관하게 Agg 캔버스에 직접 연결 (savefig 시 백엔드 전환/GUI 이벤트 처리 없음)
+        self.fig = Figure(figsize=(10, 9))
+        FigureCanvasAgg(self.fig)
+        # tight_layout 대신 고정 여백 사용 (행 하나를 잘라낸 이미지가 10:3 비율에 가깝도록)
+        self.fig.subplots_adjust(left=0.07, right=0.98, top=0.96, bottom=0.06,
+                                 wspace=0.25, hspace=0.45)
+        self.buffer = io.BytesIO()  # 행마다 재사용하는 PNG 인코딩 버퍼
+        self._times = np.empty(0, dtype=np.float64)
+        axes = self.fig.subplots(3, 2)
+        self.rows = [tuple(row) for row in axes]
+        (ax_cpu, ax_mem), (ax_disk, ax_net), (ax_temp, ax_gpu) = self.rows
+
+        # CPU 그래프
+        self.cpu_line, = ax_cpu.plot([], [], 'b-', linewidth=2)
+        ax_cpu.set_title('CPU 사용률', fontsize=12, fontweight='bold')
+        ax_cpu.set_ylabel('사용률 (%)')
+        ax_cpu.set_ylim(0, 100)
+
+        # 메모리 그래프
+        self.mem_line, = ax_mem.plot([], [], 'g-', linewidth=2)
+        ax_mem.set_title('메모리 사용률', fontsize=12, fontweight='bold')
+        ax_mem.set_ylabel('사용률 (%)')
+        ax_mem.set_ylim(0, 100)
+
+        # 디스크 I/O 그래프
+        self.disk_read_line, = ax_disk.plot([], [], 'r-', label='읽기', linewidth=2)
+        self.disk_write_line, = ax_disk.plot([], [], 'orange', label='쓰기', linewidth=2)
+        ax_disk.set_title('디스크 I/O', fontsize=12, fontweight='bold')
+        ax_disk.set_ylabel('속도 (MB/s)')
+        ax_disk.legend(loc='upper right')
+
+        # 네트워크 그래프
+        self.net_sent_line, = ax_net.plot([], [], 'm-', label='송신', linewidth=2)
+        self.net_recv_line, = ax_net.plot([], [], 'c-', label='수신', linewidth=2)
+        ax_net.set_title('네트워크 트래픽', fontsize=12, fontweight='bold')
+        ax_net.set_ylabel('속도 (MB/s)')
+        ax_net.legend(loc='upper right')
+
+        # 온도 그래프
+        self.temp_line, = ax_temp.plot([], [], 'orange', linewidth=2)
+        self.temp_na_text = ax_temp.text(0.5, 0.5, '온도 센서\n사용 불가',
+                                          ha='center', va='center',
+                                          transform=ax_temp.transAxes, fontsize=12)
+        ax_temp.set_title('시스템 온도', fontsize=12, fontweight='bold')
+        ax_temp.set_ylabel('온도 (°C)')
+
+        # GPU 그래프
+        self.gpu_line, = ax_gpu.plot([], [], 'purple', linewidth=2)
+        self.gpu_na_text = ax_gpu.text(0.5, 0.5, 'GPU\n사용 불가',
+                                        ha='center', va='center',
+                                        transform=ax_gpu.transAxes, fontsize=12)
+        ax_gpu.set_title('GPU 사용률', fontsize=12, fontweight='bold')
+        ax_gpu.set_ylabel('사용률 (%)')
+        ax_gpu.set_ylim(0, 100)
+
+        for row in self.rows:
+            for ax in row:
+                ax.set_xlabel('시간 (샘플)')
+                ax.grid(True, alpha=0.3)
+
+    def sample_axis(self, n):
+        """X축(샘플 번호) 배열 반환, 길이가 바뀔 때만 다시 생성"""
+        if len(self._times) != n:
+            self._times = np.arange(n, dtype=np.float64)
+        return self._times
+
+    def render_row(self, index, n_samples):
+        """Figure에서 지정한 행만 PNG 바이트로 변환"""
+        for i, row in enumerate(self.rows):
+            for ax in row:
+                ax.set_visible(i == index)
+        # 축 범위는 미리 계산한 값으로 고정 (relim/autoscale 생략)
+        for ax in self.rows[index]:
+            ax.set_xlim(*_padded_range(0, n_samples - 1))
+
+        # 이미지로 변환 (숨긴 행은 그려지지 않고 bbox_inches='tight'로 잘려 나감)
+        # 9 x 2.7 inch 크기로 삽입되므로 100 DPI로 충분
+        self.buffer.seek(0)
+        self.buffer.truncate()
+        self.fig.savefig(self.buffer, format='png', dpi=100, bbox_inches='tight')
+        return self.buffer.getvalue()
+
+
+_renderer = None
+
+
+def _get_renderer():
+    """현재 프로세스의 그래프 렌더러 반환 (최초 호출 시 생성)"""
+    global _renderer
+    if _renderer is None:
+        _renderer = _ChartRenderer()
+    return _renderer
+
+
+def render_cpu_memory_graph(history, stats):
+    """CPU 및 메모리 그래프를 PNG 바이트로 렌더링"""
+    renderer = _get_renderer()
+    n = len(history['cpu_percent'])
+    times = renderer.sample_axis(n)
+
+    times, cpu, mem = decimate(times, history['cpu_percent'], history['memory_percent'])
+    renderer.cpu_line.set_data(times, cpu)
+    renderer.mem_line.set_data(times, mem)
+
+    return renderer.render_row(0, n)
+
+
+def render_disk_network_graph(history, stats):
+    """디스크 및 네트워크 그래프를 PNG 바이트로 렌더링"""
+    renderer = _get_renderer()
+    n = len(history['disk_read_mb'])
+    times = renderer.sample_axis(n)
+
+    times, disk_read, disk_write, net_sent, net_recv = decimate(
+        times, history['disk_read_mb'], history['disk_write_mb'],
+        history['net_sent_mb'], history['net_recv_mb'])
+
+    # 디스크 I/O 그래프 (히스토리가 이미 MB/s 단위)
+    renderer.disk_read_line.set_data(times, disk_read)
+    renderer.disk_write_line.set_data(times, disk_write)
+    renderer.disk_read_line.axes.set_ylim(*_padded_range(
+        min(stats['disk_read_mb'][1], stats['disk_write_mb'][1]),
+        max(stats['disk_read_mb'][2], stats['disk_write_mb'][2])))
+
+    # 네트워크 그래프
+    renderer.net_sent_line.set_data(times, net_sent)
+    renderer.net_recv_line.set_data(times, net_recv)
+    renderer.net_sent_line.axes.set_ylim(*_padded_range(
+        min(stats['net_sent_mb'][1], stats['net_recv_mb'][1]),
+        max(stats['net_sent_mb'][2], stats['net_recv_mb'][2])))
+
+    return renderer.render_row(1, n)
+
+
+def render_temp_gpu_graph(history, stats):
+    """온도 및 GPU 그래프를 PNG 바이트로 렌더링"""
+    renderer = _get_renderer()
+    n = len(history['temperatures'])
+    times = renderer.sample_axis(n)
+
+    # 온도 그래프
+    _, temp_min, temp_max, _ = stats['temperatures']
+    temp_available = temp_max > 0
+    times, temps, gpu_usage = decimate(times, history['temperatures'], history['gpu_usage'])
+    renderer.temp_line.set_data(times, temps)
+    renderer.temp_line.set_visible(temp_available)
+    renderer.temp_na_text.set_visible(not temp_available)
+    renderer.temp_line.axes.set_ylim(*_padded_range(temp_min, temp_max))
+
+    # GPU 그래프
+    gpu_available = stats['gpu_usage'][2] > 0
+    renderer.gpu_line.set_data(times, gpu_usage)
+    renderer.gpu_line.set_visible(gpu_available)
+    renderer.gpu_na_text.set_visible(not gpu_available)
+
+    return renderer.render_row(2, n)
+
+
+GRAPH_RENDERERS = (render_cpu_memory_graph, render_disk_network_graph, render_temp_gpu_graph)
+
+_executor = None
+
+
+def _get_executor():
+    """그래프 렌더링용 프로세스 풀 반환 (최초 호출 시 생성, 이후 리포트에서 재사용)"""
+    global _executor
+    if _executor is None:
+        # UI 프로세스는 Tk와 스레드를 사용 중이므로 fork 대신 forkserver/spawn 사용
+        if 'forkserver' in multiprocessing.get_all_start_methods():
+            context = multiprocessing.get_context('forkserver')
+            context.set_forkserver_preload([__name__])
+        else:
+            context = multiprocessing.get_context('spawn')
+        _executor = ProcessPoolExecutor(max_workers=len(GRAPH_RENDERERS), mp_context=context)
+    return _executor
+
+
+def _discard_executor():
+    """고장 난 프로세스 풀 정리 (다음 리포트에서 새로 생성)"""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False)
+        _executor = None
 
 
 class PDFReportGenerator:
@@ -53,6 +266,9 @@ class PDFReportGenerator:
             spaceBefore=12
         )
 
+        # 통계는 한 번만 계산해 통계 표와 그래프 축 범위에 함께 사용
+        self._stats = self._compute_statistics()
+
         # 문서 요소 리스트
         story = []
 
@@ -77,22 +293,12 @@ class PDFReportGenerator:
         story.append(Paragraph("2. 리소스 사용 그래프", heading_style))
         story.append(Spacer(1, 0.1 * inch))
 
-        # CPU 및 메모리 그래프
-        cpu_mem_img = self._create_cpu_memory_graph()
-        if cpu_mem_img:
-            story.append(cpu_mem_img)
-            story.append(Spacer(1, 0.2 * inch))
-
-        # 디스크 및 네트워크 그래프
-        disk_net_img = self._create_disk_network_graph()
-        if disk_net_img:
-            story.append(disk_net_img)
-            story.append(Spacer(1, 0.2 * inch))
-
-        # 온도 및 GPU 그래프
-        temp_gpu_img = self._create_temp_gpu_graph()
-        if temp_gpu_img:
-            story.append(temp_gpu_img)
+        # CPU/메모리, 디스크/네트워크, 온도/GPU 그래프
+        graph_images = self._create_graph_images()
+        for i, img in enumerate(graph_images):
+            story.append(img)
+            if i < len(graph_images) - 1:
+                story.append(Spacer(1, 0.2 * inch))
 
         # 페이지 구분
         story.append(PageBreak())
@@ -108,16 +314,19 @@ class PDFReportGenerator:
 
     def _generate_summary(self):
         """요약 정보 생성"""
-        if not self.history['timestamps']:
+        if len(self.history['timestamps']) == 0:
             return []
 
-        duration = (self.history['timestamps'][-1] - self.history['timestamps'][0]).total_seconds()
+        # 타임스탬프는 ns 정수로 저장되어 있으므로 표시할 두 시점만 datetime으로 변환
+        first_ns = int(self.history['timestamps'][0])
+        last_ns = int(self.history['timestamps'][-1])
+        duration = (last_ns - first_ns) / 1e9
 
         summary = [
             ["모니터링 기간", f"{duration:.1f}초"],
             ["데이터 포인트", f"{len(self.history['timestamps'])}개"],
-            ["시작 시간", self.history['timestamps'][0].strftime("%Y-%m-%d %H:%M:%S")],
-            ["종료 시간", self.history['timestamps'][-1].strftime("%Y-%m-%d %H:%M:%S")],
+            ["시작 시간", ns_to_datetime(first_ns).strftime("%Y-%m-%d %H:%M:%S")],
+            ["종료 시간", ns_to_datetime(last_ns).strftime("%Y-%m-%d %H:%M:%S")],
         ]
 
         return summary
@@ -137,212 +346,65 @@ class PDFReportGenerator:
         ]))
         return table
 
-    def _create_cpu_memory_graph(self):
-        """CPU 및 메모리 그래프 생성"""
-        if not self.history['timestamps']:
-            return None
-
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(10, 3))
-
-        times = list(range(len(self.history['timestamps'])))
-
-        # CPU 그래프
-        ax1.plot(times, self.history['cpu_percent'], 'b-', linewidth=2)
-        ax1.set_title('CPU 사용률', fontsize=12, fontweight='bold')
-        ax1.set_xlabel('시간 (샘플)')
-        ax1.set_ylabel('사용률 (%)')
-        ax1.set_ylim(0, 100)
-        ax1.grid(True, alpha=0.3)
-
-        # 메모리 그래프
-        ax2.plot(times, self.history['memory_percent'], 'g-', linewidth=2)
-        ax2.set_title('메모리 사용률', fontsize=12, fontweight='bold')
-        ax2.set_xlabel('시간 (샘플)')
-        ax2.set_ylabel('사용률 (%)')
-        ax2.set_ylim(0, 100)
-        ax2.grid(True, alpha=0.3)
-
-        plt.tight_layout()
-
-        # 이미지로 변환
-        img_buffer = io.BytesIO()
-        plt.savefig(img_buffer, format='png', dpi=150, bbox_inches='tight')
-        img_buffer.seek(0)
-        plt.close(fig)
-
-        img = Image(img_buffer, width=9 * inch, height=2.7 * inch)
-        return img
-
-    def _create_disk_network_graph(self):
-        """디스크 및 네트워크 그래프 생성"""
-        if not self.history['timestamps']:
-            return None
-
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(10, 3))
-
-        times = list(range(len(self.history['timestamps'])))
-
-        # 디스크 I/O 그래프
-        disk_read_mb = [x / (1024 * 1024) for x in self.history['disk_read']]
-        disk_write_mb = [x / (1024 * 1024) for x in self.history['disk_write']]
-        ax1.plot(times, disk_read_mb, 'r-', label='읽기', linewidth=2)
-        ax1.plot(times, disk_write_mb, 'orange', label='쓰기', linewidth=2)
-        ax1.set_title('디스크 I/O', fontsize=12, fontweight='bold')
-        ax1.set_xlabel('시간 (샘플)')
-        ax1.set_ylabel('속도 (MB/s)')
-        ax1.legend(loc='upper right')
-        ax1.grid(True, alpha=0.3)
-
-        # 네트워크 그래프
-        net_sent_mb = [x / (1024 * 1024) for x in self.history['net_sent']]
-        net_recv_mb = [x / (1024 * 1024) for x in self.history['net_recv']]
-        ax2.plot(times, net_sent_mb, 'm-', label='송신', linewidth=2)
-        ax2.plot(times, net_recv_mb, 'c-', label='수신', linewidth=2)
-        ax2.set_title('네트워크 트래픽', fontsize=12, fontweight='bold')
-        ax2.set_xlabel('시간 (샘플)')
-        ax2.set_ylabel('속도 (MB/s)')
-        ax2.legend(loc='upper right')
-        ax2.grid(True, alpha=0.3)
-
-        plt.tight_layout()
-
-        # 이미지로 변환
-        img_buffer = io.BytesIO()
-        plt.savefig(img_buffer, format='png', dpi=150, bbox_inches='tight')
-        img_buffer.seek(0)
-        plt.close(fig)
-
-        img = Image(img_buffer, width=9 * inch, height=2.7 * inch)
-        return img
-
-    def _create_temp_gpu_graph(self):
-        """온도 및 GPU 그래프 생성"""
-        if not self.history['timestamps']:
-            return None
-
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(10, 3))
-
-        times = list(range(len(self.history['timestamps'])))
-
-        # 온도 그래프
-        if any(t > 0 for t in self.history['temperatures']):
-            ax1.plot(times, self.history['temperatures'], 'orange', linewidth=2)
-            ax1.set_title('시스템 온도', fontsize=12, fontweight='bold')
-            ax1.set_xlabel('시간 (샘플)')
-            ax1.set_ylabel('온도 (°C)')
-            ax1.grid(True, alpha=0.3)
-        else:
-            ax1.text(0.5, 0.5, '온도 센서\n사용 불가',
-                    ha='center', va='center', transform=ax1.transAxes, fontsize=12)
-            ax1.set_title('시스템 온도', fontsize=12, fontweight='bold')
-
-        # GPU 그래프
-        if any(g > 0 for g in self.history['gpu_usage']):
-            ax2.plot(times, self.history['gpu_usage'], 'purple', linewidth=2)
-            ax2.set_title('GPU 사용률', fontsize=12, fontweight='bold')
-            ax2.set_xlabel('시간 (샘플)')
-            ax2.set_ylabel('사용률 (%)')
-            ax2.set_ylim(0, 100)
-            ax2.grid(True, alpha=0.3)
-        else:
-            ax2.text(0.5, 0.5, 'GPU\n사용 불가',
-                    ha='center', va='center', transform=ax2.transAxes, fontsize=12)
-            ax2.set_title('GPU 사용률', fontsize=12, fontweight='bold')
-
-        plt.tight_layout()
-
-        # 이미지로 변환
-        img_buffer = io.BytesIO()
-        plt.savefig(img_buffer, format='png', dpi=150, bbox_inches='tight')
-        img_buffer.seek(0)
-        plt.close(fig)
+    def _create_graph_images(self):
+        """그래프 3개를 워커 프로세스에서 병렬로 렌더링"""
+        if len(self.history['timestamps']) == 0:
+            return []
 
-        img = Image(img_buffer, width=9 * inch, height=2.7 * inch)
-        return img
+        history = {key: self.history[key] for key in HISTORY_FIELDS}
+
+        images = None
+        if (os.cpu_count() or 1) > 1:
+            try:
+                executor = _get_executor()
+                futures = [executor.submit(render, history, self._stats) for render in GRAPH_RENDERERS]
+                images = [future.result() for future in futures]
+            except (BrokenProcessPool, OSError):
+                # 워커가 비정상 종료했거나 풀을 시작할 수 없음: 풀을 버리고 이번 리포트는 현재 프로세스에서 렌더링
+                _discard_executor()
+        if images is None:
+            # 단일 코어에서는 프로세스 풀의 이점이 없으므로 현재 프로세스에서 렌더링
+            images = [render(history, self._stats) for render in GRAPH_RENDERERS]
+
+        return [Image(io.BytesIO(data), width=9 * inch, height=2.7 * inch) for data in images]
+
+    def _compute_statistics(self):
+        """항목별 (평균, 최소, 최대, 표준편차) 계산 (표시 단위 기준)"""
+        if len(self.history['timestamps']) == 0:
+            return {}
+
+        return {
+            key: compute_stats(self.history[key])
+            for key in HISTORY_FIELDS
+        }
 
     def _generate_statistics(self):
         """상세 통계 생성"""
-        if not self.history['timestamps']:
+        if len(self.history['timestamps']) == 0:
             return []
 
         stats = [
             ["리소스", "평균", "최소", "최대", "표준편차"],
         ]
 
-        # CPU
-        cpu_data = self.history['cpu_percent']
-        if cpu_data:
-            import statistics
-            stats.append([
-                "CPU 사용률 (%)",
-                f"{statistics.mean(cpu_data):.2f}",
-                f"{min(cpu_data):.2f}",
-                f"{max(cpu_data):.2f}",
-                f"{statistics.stdev(cpu_data) if len(cpu_data) > 1 else 0:.2f}"
-            ])
-
-        # 메모리
-        mem_data = self.history['memory_percent']
-        if mem_data:
-            import statistics
-            stats.append([
-                "메모리 사용률 (%)",
-                f"{statistics.mean(mem_data):.2f}",
-                f"{min(mem_data):.2f}",
-                f"{max(mem_data):.2f}",
-                f"{statistics.stdev(mem_data) if len(mem_data) > 1 else 0:.2f}"
-            ])
-
-        # 디스크 읽기
-        disk_read = self.history['disk_read']
-        if disk_read:
-            import statistics
-            disk_read_mb = [x / (1024 * 1024) for x in disk_read]
-            stats.append([
-                "디스크 읽기 (MB/s)",
-                f"{statistics.mean(disk_read_mb):.2f}",
-                f"{min(disk_read_mb):.2f}",
-                f"{max(disk_read_mb):.2f}",
-                f"{statistics.stdev(disk_read_mb) if len(disk_read_mb) > 1 else 0:.2f}"
-            ])
-
-        # 디스크 쓰기
-        disk_write = self.history['disk_write']
-        if disk_write:
-            import statistics
-            disk_write_mb = [x / (1024 * 1024) for x in disk_write]
-            stats.append([
-                "디스크 쓰기 (MB/s)",
-                f"{statistics.mean(disk_write_mb):.2f}",
-                f"{min(disk_write_mb):.2f}",
-                f"{max(disk_write_mb):.2f}",
-                f"{statistics.stdev(disk_write_mb) if len(disk_write_mb) > 1 else 0:.2f}"
-            ])
-
-        # 네트워크 송신
-        net_sent = self.history['net_sent']
-        if net_sent:
-            import statistics
-            net_sent_mb = [x / (1024 * 1024) for x in net_sent]
-            stats.append([
-                "네트워크 송신 (MB/s)",
-                f"{statistics.mean(net_sent_mb):.2f}",
-                f"{min(net_sent_mb):.2f}",
-                f"{max(net_sent_mb):.2f}",
-                f"{statistics.stdev(net_sent_mb) if len(net_sent_mb) > 1 else 0:.2f}"
-            ])
+        # (표시 이름, 히스토리 키)
+        metrics = [
+            ("CPU 사용률 (%)", 'cpu_percent'),
+            ("메모리 사용률 (%)", 'memory_percent'),
+            ("디스크 읽기 (MB/s)", 'disk_read_mb'),
+            ("디스크 쓰기 (MB/s)", 'disk_write_mb'),
+            ("네트워크 송신 (MB/s)", 'net_sent_mb'),
+            ("네트워크 수신 (MB/s)", 'net_recv_mb'),
+        ]
 
-        # 네트워크 수신
-        net_recv = self.history['net_recv']
-        if net_recv:
-            import statistics
-            net_recv_mb = [x / (1024 * 1024) for x in net_recv]
+        for name, key in metrics:
+            mean, low, high, std = self._stats[key]
             stats.append([
-                "네트워크 수신 (MB/s)",
-                f"{statistics.mean(net_recv_mb):.2f}",
-                f"{min(net_recv_mb):.2f}",
-                f"{max(net_recv_mb):.2f}",
-                f"{statistics.stdev(net_recv_mb) if len(net_recv_mb) > 1 else 0:.2f}"
+                name,
+                f"{mean:.2f}",
+                f"{low:.2f}",
+                f"{high:.2f}",
+                f"{std:.2f}"
             ])
 
         return stats
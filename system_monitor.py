@@ -4,78 +4,353 @@ System Resource Monitor Module
 """
 
 import psutil
+import numpy as np
+import functools
+import math
+import operator
+import os
+import subprocess
+import sys
+import threading
 import time
+import warnings
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Optional
 
+try:
+    # NVIDIA GPU 정보 (선택사항, 없으면 nvidia-smi 사용)
+    import pynvml
+except ImportError:
+    pynvml = None
+
+# 바이트 -> MB 변환 계수
+INV_MB = 1.0 / (1024 * 1024)
+
+# format_bytes 표시 단위 (1024배씩)
+BYTE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+# 히스토리에 저장하는 수치 항목 (항목별로 연속된 NumPy 배열에 저장)
+# 디스크/네트워크 속도는 표시 단위인 MB/s로 저장 (스냅샷의 *_speed는 바이트/초 유지)
+HISTORY_FIELDS = (
+    'cpu_percent', 'memory_percent', 'disk_read_mb', 'disk_write_mb',
+    'net_sent_mb', 'net_recv_mb', 'temperatures', 'gpu_usage'
+)
+
+# 히스토리 링 버퍼 기본 크기 (샘플 수, 2Hz 수집 시 30분)
+DEFAULT_HISTORY_SIZE = 3600
+
+
+def _history_size_from_env() -> int:
+    """SYSMON_HISTORY 환경 변수 읽기 (없거나 1 미만의 정수가 아니면 경고 후 기본값)"""
+    value = os.environ.get('SYSMON_HISTORY')
+    if value is None:
+        return DEFAULT_HISTORY_SIZE
+    try:
+        size = int(value)
+    except ValueError:
+        size = 0
+    if size < 1:
+        warnings.warn(
+            f"SYSMON_HISTORY={value!r}는 1 이상의 정수가 아니므로 "
+            f"기본값 {DEFAULT_HISTORY_SIZE}을 사용합니다"
+        )
+        return DEFAULT_HISTORY_SIZE
+    return size
+
+
+# 히스토리 링 버퍼 크기 (샘플 수), 가득 차면 가장 오래된 샘플부터 덮어씀
+# SYSMON_HISTORY 환경 변수로 변경 가능
+HISTORY_SIZE = _history_size_from_env()
+
+# 느리게 바뀌는 항목의 기본 캐시 유효 시간 (초), 원본 갱신 주기보다 자주 읽지 않음
+GPU_TTL = 0.1
+TEMPERATURE_TTL = 1.0  # hwmon 센서는 보통 1초 주기로 갱신
+DISK_TTL = 0.2
+CPU_FREQ_TTL = 0.25  # 주파수는 거버너 주기로 바뀌며, 조회 비용은 코어 수에 비례
+
+# 그래프 한 개에 그리는 최대 점 개수 (그래프 폭 ~400px의 2배)
+PLOT_POINTS = 800
+
+# collect_snapshot에서 수집할 수 있는 항목 (기본값은 전체)
+SECTIONS = frozenset({'cpu', 'memory', 'disk', 'network', 'temperature', 'gpu'})
+
+# Linux에서 psutil 대신 직접 읽는 /proc 파일
+PROC_FILES = {
+    'stat': '/proc/stat',
+    'meminfo': '/proc/meminfo',
+    'diskstats': '/proc/diskstats',
+    'net_dev': '/proc/net/dev',
+}
+
+# pynvml이 없을 때 상주시키는 nvidia-smi 루프 모드 명령 (첫 번째 GPU, 500ms마다 한 줄 출력)
+NVIDIA_SMI_COMMAND = [
+    'nvidia-smi', '--id=0',
+    '--query-gpu=utilization.gpu,memory.used,temperature.gpu',
+    '--format=csv,noheader,nounits', '-lms', '500',
+]
+
+# 이보다 오래된 nvidia-smi 출력은 사용하지 않음 (출력 주기의 4배, 프로세스가 멈춘 경우 대비)
+NVIDIA_SMI_MAX_AGE = 2.0
+
+# 온도 센서 항목(namedtuple)에서 현재 값 꺼내기
+_get_current = operator.attrgetter('current')
+
+# /proc/diskstats의 섹터 크기 (커널은 장치와 관계없이 512바이트 단위로 보고)
+SECTOR_SIZE = 512
+
+
+class _ProcFile:
+    """/proc 파일을 한 번만 열어 두고 매번 pread로 처음부터 다시 읽음 (경로 조회 생략)"""
+
+    def __init__(self, path: str, bufsize: int = 65536):
+        self.fd = os.open(path, os.O_RDONLY)
+        self.bufsize = bufsize
+
+    def read(self) -> bytes:
+        chunks = []
+        offset = 0
+        while True:
+            # seq_file은 한 번에 자체 버퍼(약 한 페이지)만큼만 돌려주므로
+            # 짧게 읽혀도 파일 끝이 아님: 빈 결과가 나올 때까지 다음 위치에서 계속 읽음
+            chunk = os.pread(self.fd, self.bufsize, offset)
+            if not chunk:
+                return b''.join(chunks)
+            chunks.append(chunk)
+            offset += len(chunk)
+
+    def close(self):
+        os.close(self.fd)
+
+
+def _open_proc_files() -> Optional[Dict[str, _ProcFile]]:
+    """Linux이면 PROC_FILES를 열어서 반환, 그 외나 실패 시 None (psutil 사용)"""
+    if not sys.platform.startswith('linux'):
+        return None
+    try:
+        return {name: _ProcFile(path) for name, path in PROC_FILES.items()}
+    except OSError:
+        return None
+
+
+def _cpu_busy_percent(prev: tuple, cur: tuple) -> float:
+    """(전체, 유휴) jiffies 두 시점으로 사용률 계산 (psutil.cpu_percent와 같은 방식)"""
+    total_delta = cur[0] - prev[0]
+    if total_delta <= 0:
+        return 0.0
+    busy_delta = (cur[0] - cur[1]) - (prev[0] - prev[1])
+    return round(min(max(100.0 * busy_delta / total_delta, 0.0), 100.0), 1)
+
 
 class SystemMonitor:
     """시스템 리소스 모니터링 클래스"""
 
-    def __init__(self):
-        self.history = {
-            'timestamps': [],
-            'cpu_percent': [],
-            'memory_percent': [],
-            'disk_read': [],
-            'disk_write': [],
-            'net_sent': [],
-            'net_recv': [],
-            'temperatures': [],
-            'gpu_usage': []
-        }
-        self.start_time = time.time()
-        self._prev_net_io = psutil.net_io_counters()
-        self._prev_disk_io = psutil.disk_io_counters()
-        self._prev_time = time.time()
+    def __init__(self, history_size: int = HISTORY_SIZE, gpu_ttl: float = GPU_TTL,
+                 temperature_ttl: float = TEMPERATURE_TTL, disk_ttl: float = DISK_TTL,
+                 cpu_freq_ttl: float = CPU_FREQ_TTL):
+        # 히스토리 링 버퍼: _head는 다음에 쓸 위치, _count는 저장된 샘플 수
+        # timestamps는 time.time_ns() 정수 (datetime 객체 대신 8바이트 값으로 저장)
+        if history_size < 1:
+            raise ValueError(f"history_size는 1 이상이어야 합니다: {history_size}")
+        self.history_size = history_size
+        self._history = {'timestamps': np.zeros(history_size, dtype=np.int64)}
+        for key in HISTORY_FIELDS:
+            self._history[key] = np.zeros(history_size, dtype=np.float32)
+        self._head = 0
+        self._count = 0
+        # 수집 스레드와 UI 스레드(clear_history/get_history) 사이에서 _head/_count를 보호
+        # _generation은 clear_history마다 증가하며, 초기화 전에 시작된 스냅샷은 기록하지 않음
+        self._lock = threading.Lock()
+        self._generation = 0
+        self.start_time = time.monotonic()  # elapsed_time 기준 (단조 시계)
+        # Linux에서는 /proc 파일을 직접 읽고, 그 외에는 psutil 사용
+        self._proc = _open_proc_files()
+        self._block_devices = {}
+        # 논리 CPU 개수는 실행 중에 바뀌지 않으므로 한 번만 조회
+        self._cpu_count = psutil.cpu_count(logical=True)
+        # 온도 센서 함수는 플랫폼에 따라 없음 (psutil 빌드마다 고정이므로 한 번만 확인)
+        self._sensors_fn = getattr(psutil, 'sensors_temperatures', None)
+        # NVML 장치 핸들 (첫 GPU 조회 시 초기화, NVML을 쓸 수 없으면 nvidia-smi로 전환)
+        self._use_nvml = pynvml is not None
+        self._nvml_handles = None
+        # nvidia-smi 루프 모드 프로세스와 읽기 스레드가 마지막으로 받은 출력 줄
+        self._nvsmi_proc = None
+        self._nvsmi_failed = False
+        self._latest_gpu_line = (0.0, None)  # (받은 시각 time.monotonic(), 출력 줄)
+        self._prev_net_io = self._read_net_io()
+        self._prev_disk_io = self._read_disk_io()
+        # 속도 계산용 이전 시각 (단조 시계, 디스크는 TTL 캐시로 수집 시점이 달라 따로 보관)
+        self._prev_monotonic = time.monotonic()
+        self._prev_disk_monotonic = self._prev_monotonic
+        # 항목별 캐시: {키: (값, 만료 시각)}
+        self.gpu_ttl = gpu_ttl
+        self.temperature_ttl = temperature_ttl
+        self.disk_ttl = disk_ttl
+        self.cpu_freq_ttl = cpu_freq_ttl
+        self._cache = {}
+        # GPU/온도처럼 오래 걸리는 수집을 다른 항목과 동시에 실행하기 위한 스레드 풀
+        self._pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix='sysmon')
+        # CPU 사용률 기준점 설정 (이후 호출은 직전 호출과의 차이로 계산하므로 대기하지 않음)
+        if self._proc:
+            self._prev_cpu_times = self._read_cpu_times()
+        else:
+            psutil.cpu_percent(interval=None)
+            psutil.cpu_percent(interval=None, percpu=True)
+
+    def _read_cpu_times(self) -> List[tuple]:
+        """/proc/stat에서 [전체, cpu0, cpu1, ...]의 (전체, 유휴) jiffies 읽기"""
+        times = []
+        for line in self._proc['stat'].read().split(b'\n'):
+            if not line.startswith(b'cpu'):
+                break
+            # user nice system idle iowait irq softirq steal (guest는 user에 이미 포함)
+            fields = [int(v) for v in line.split()[1:9]]
+            times.append((sum(fields), fields[3] + fields[4]))
+        return times
+
+    def _read_meminfo(self) -> Dict[bytes, int]:
+        """/proc/meminfo를 {항목: 바이트} 형태로 읽기"""
+        meminfo = {}
+        for line in self._proc['meminfo'].read().split(b'\n'):
+            fields = line.split()
+            if len(fields) >= 2:
+                meminfo[fields[0].rstrip(b':')] = int(fields[1]) * 1024
+        return meminfo
+
+    def _is_block_device(self, name: bytes) -> bool:
+        """파티션이 아닌 디스크인지 확인 (psutil과 같이 /sys/block 기준, 결과 캐시)"""
+        result = self._block_devices.get(name)
+        if result is None:
+            path = b'/sys/block/' + name.replace(b'/', b'!')
+            result = self._block_devices[name] = os.path.exists(path)
+        return result
+
+    def _read_disk_io(self) -> Optional[tuple]:
+        """전체 디스크의 누적 (읽기 바이트, 쓰기 바이트), 알 수 없으면 None"""
+        if not self._proc:
+            disk_io = psutil.disk_io_counters()
+            return (disk_io.read_bytes, disk_io.write_bytes) if disk_io else None
+
+        read_sectors = 0
+        write_sectors = 0
+        for line in self._proc['diskstats'].read().split(b'\n'):
+            # 필요한 열은 [9]까지이므로 나머지(10개 이상)는 쪼개지 않음
+            fields = line.split(None, 10)
+            if len(fields) >= 10 and self._is_block_device(fields[2]):
+                read_sectors += int(fields[5])
+                write_sectors += int(fields[9])
+        return (read_sectors * SECTOR_SIZE, write_sectors * SECTOR_SIZE)
+
+    def _read_net_io(self) -> tuple:
+        """전체 인터페이스의 누적 (송신 바이트, 수신 바이트, 송신 패킷, 수신 패킷)"""
+        if not self._proc:
+            net_io = psutil.net_io_counters()
+            return (net_io.bytes_sent, net_io.bytes_recv,
+                    net_io.packets_sent, net_io.packets_recv)
+
+        sent = recv = packets_sent = packets_recv = 0
+        # 처음 두 줄은 헤더
+        for line in self._proc['net_dev'].read().split(b'\n')[2:]:
+            _, sep, counters = line.partition(b':')
+            if not sep:
+                continue
+            # 필요한 열은 [9]까지 (송신 쪽 나머지 열은 쪼개지 않음)
+            fields = counters.split(None, 10)
+            recv += int(fields[0])
+            packets_recv += int(fields[1])
+            sent += int(fields[8])
+            packets_sent += int(fields[9])
+        return (sent, recv, packets_sent, packets_recv)
 
     def get_cpu_info(self) -> Dict:
-        """CPU 정보 수집"""
-        cpu_percent = psutil.cpu_percent(interval=0.1)
-        cpu_count = psutil.cpu_count(logical=True)
-        cpu_freq = psutil.cpu_freq()
-
-        per_cpu = psutil.cpu_percent(interval=0.1, percpu=True)
+        """CPU 정보 수집 (사용률은 직전 수집 이후 구간 기준, 첫 수집은 0.0일 수 있음)"""
+        if self._proc:
+            times = self._read_cpu_times()
+            prev = self._prev_cpu_times
+            self._prev_cpu_times = times
+            cpu_percent = _cpu_busy_percent(prev[0], times[0])
+            if len(prev) == len(times):
+                per_cpu = [_cpu_busy_percent(p, c) for p, c in zip(prev[1:], times[1:])]
+            else:
+                # CPU 핫플러그로 개수가 바뀐 경우 이번 구간은 0으로 처리
+                per_cpu = [0.0] * (len(times) - 1)
+        else:
+            cpu_percent = psutil.cpu_percent(interval=None)
+            per_cpu = psutil.cpu_percent(interval=None, percpu=True)
+        cpu_freq = self._ttl_get('cpu_freq', self._read_cpu_freq, self.cpu_freq_ttl)
 
         return {
             'percent': cpu_percent,
-            'count': cpu_count,
-            'frequency': cpu_freq.current if cpu_freq else 0,
+            'count': self._cpu_count,
+            'frequency': cpu_freq,
             'per_cpu': per_cpu
         }
 
+    def _read_cpu_freq(self) -> float:
+        """현재 CPU 주파수 (MHz, 전체 코어 평균), 알 수 없으면 0"""
+        try:
+            cpu_freq = psutil.cpu_freq()
+        except (OSError, NotImplementedError):
+            cpu_freq = None
+        return cpu_freq.current if cpu_freq else 0
+
     def get_memory_info(self) -> Dict:
         """메모리 정보 수집"""
-        memory = psutil.virtual_memory()
-        swap = psutil.swap_memory()
+        if not self._proc:
+            memory = psutil.virtual_memory()
+            swap = psutil.swap_memory()
+
+            return {
+                'percent': memory.percent,
+                'total': memory.total,
+                'available': memory.available,
+                'used': memory.used,
+                'swap_percent': swap.percent,
+                'swap_total': swap.total,
+                'swap_used': swap.used
+            }
+
+        # psutil.virtual_memory()/swap_memory()의 Linux 계산 방식과 동일
+        meminfo = self._read_meminfo()
+        total = meminfo[b'MemTotal']
+        free = meminfo[b'MemFree']
+        cached = meminfo.get(b'Cached', 0) + meminfo.get(b'SReclaimable', 0)
+        used = total - free - meminfo.get(b'Buffers', 0) - cached
+        if used < 0:
+            used = total - free
+        available = meminfo.get(b'MemAvailable', free + cached)
+        swap_total = meminfo.get(b'SwapTotal', 0)
+        swap_used = swap_total - meminfo.get(b'SwapFree', 0)
 
         return {
-            'percent': memory.percent,
-            'total': memory.total,
-            'available': memory.available,
-            'used': memory.used,
-            'swap_percent': swap.percent,
-            'swap_total': swap.total,
-            'swap_used': swap.used
+            'percent': round((total - available) / total * 100, 1) if total else 0.0,
+            'total': total,
+            'available': available,
+            'used': used,
+            'swap_percent': round(swap_used / swap_total * 100, 1) if swap_total else 0.0,
+            'swap_total': swap_total,
+            'swap_used': swap_used
         }
 
-    def get_disk_info(self) -> Dict:
-        """디스크 정보 수집"""
+    def get_disk_info(self, now: Optional[float] = None) -> Dict:
+        """디스크 정보 수집 (now: 이번 수집의 time.monotonic() 값, 생략 시 직접 조회)"""
         disk_usage = psutil.disk_usage('/')
-        disk_io = psutil.disk_io_counters()
+        disk_io = self._read_disk_io()
 
-        current_time = time.time()
-        time_delta = current_time - self._prev_time
+        if now is None:
+            now = time.monotonic()
+        time_delta = now - self._prev_disk_monotonic
 
         if time_delta > 0 and disk_io and self._prev_disk_io:
-            read_speed = (disk_io.read_bytes - self._prev_disk_io.read_bytes) / time_delta
-            write_speed = (disk_io.write_bytes - self._prev_disk_io.write_bytes) / time_delta
+            read_speed = (disk_io[0] - self._prev_disk_io[0]) / time_delta
+            write_speed = (disk_io[1] - self._prev_disk_io[1]) / time_delta
         else:
             read_speed = 0
             write_speed = 0
 
         if disk_io:
             self._prev_disk_io = disk_io
+        self._prev_disk_monotonic = now
 
         return {
             'percent': disk_usage.percent,
@@ -86,50 +361,55 @@ class SystemMonitor:
             'write_speed': write_speed
         }
 
-    def get_network_info(self) -> Dict:
-        """네트워크 정보 수집"""
-        net_io = psutil.net_io_counters()
+    def get_network_info(self, now: Optional[float] = None) -> Dict:
+        """네트워크 정보 수집 (now: 이번 수집의 time.monotonic() 값, 생략 시 직접 조회)"""
+        net_io = self._read_net_io()
+        bytes_sent, bytes_recv, packets_sent, packets_recv = net_io
 
-        current_time = time.time()
-        time_delta = current_time - self._prev_time
+        if now is None:
+            now = time.monotonic()
+        time_delta = now - self._prev_monotonic
 
         if time_delta > 0:
-            sent_speed = (net_io.bytes_sent - self._prev_net_io.bytes_sent) / time_delta
-            recv_speed = (net_io.bytes_recv - self._prev_net_io.bytes_recv) / time_delta
+            sent_speed = (bytes_sent - self._prev_net_io[0]) / time_delta
+            recv_speed = (bytes_recv - self._prev_net_io[1]) / time_delta
         else:
             sent_speed = 0
             recv_speed = 0
 
         self._prev_net_io = net_io
-        self._prev_time = current_time
+        self._prev_monotonic = now
 
         return {
-            'bytes_sent': net_io.bytes_sent,
-            'bytes_recv': net_io.bytes_recv,
+            'bytes_sent': bytes_sent,
+            'bytes_recv': bytes_recv,
             'sent_speed': sent_speed,
             'recv_speed': recv_speed,
-            'packets_sent': net_io.packets_sent,
-            'packets_recv': net_io.packets_recv
+            'packets_sent': packets_sent,
+            'packets_recv': packets_recv
         }
 
     def get_temperature_info(self) -> Dict:
         """온도 정보 수집 (가능한 경우)"""
         temps = {}
+        if self._sensors_fn is None:
+            return temps
         try:
-            if hasattr(psutil, "sensors_temperatures"):
-                sensors = psutil.sensors_temperatures()
-                if sensors:
-                    for name, entries in sensors.items():
-                        if entries:
-                            temps[name] = [entry.current for entry in entries]
-        except Exception as e:
-            # 온도 센서를 지원하지 않는 시스템
+            sensors = self._sensors_fn()
+        except OSError as e:
+            # 센서 파일을 읽을 수 없는 시스템
             temps['error'] = str(e)
+            return temps
+
+        if sensors:
+            for name, entries in sensors.items():
+                if entries:
+                    temps[name] = list(map(_get_current, entries))
 
         return temps
 
     def get_gpu_info(self) -> Dict:
-        """GPU 정보 수집 (가능한 경우)"""
+        """GPU 정보 수집 (가능한 경우, 첫 번째 GPU 기준)"""
         gpu_info = {
             'available': False,
             'usage': 0,
@@ -137,84 +417,252 @@ class SystemMonitor:
             'temperature': 0
         }
 
-        try:
-            # nvidia-smi를 통한 GPU 정보 수집 시도
-            import subprocess
-            result = subprocess.run(
-                ['nvidia-smi', '--query-gpu=utilization.gpu,memory.used,temperature.gpu',
-                 '--format=csv,noheader,nounits'],
-                capture_output=True,
-                text=True,
-                timeout=2
-            )
-            if result.returncode == 0:
-                values = result.stdout.strip().split(', ')
-                if len(values) >= 3:
+        if self._use_nvml and self._init_nvml():
+            try:
+                if self._nvml_handles:
+                    handle = self._nvml_handles[0]
+                    gpu_info['usage'] = float(pynvml.nvmlDeviceGetUtilizationRates(handle).gpu)
+                    # nvidia-smi의 memory.used와 같은 MiB 단위
+                    gpu_info['memory'] = pynvml.nvmlDeviceGetMemoryInfo(handle).used / (1024 * 1024)
+                    gpu_info['temperature'] = float(pynvml.nvmlDeviceGetTemperature(
+                        handle, pynvml.NVML_TEMPERATURE_GPU))
                     gpu_info['available'] = True
+            except pynvml.NVMLError:
+                # GPU 정보를 사용할 수 없음
+                pass
+            return gpu_info
+
+        # 상주 중인 nvidia-smi가 마지막으로 출력한 줄 사용
+        # (첫 출력 전이나 NVIDIA_SMI_MAX_AGE 동안 새 출력이 없으면 사용 불가)
+        line = None
+        if self._start_nvidia_smi():
+            received, line = self._latest_gpu_line
+            if time.monotonic() - received > NVIDIA_SMI_MAX_AGE:
+                line = None
+        if line:
+            values = line.split(', ')
+            try:
+                if len(values) >= 3:
                     gpu_info['usage'] = float(values[0])
                     gpu_info['memory'] = float(values[1])
                     gpu_info['temperature'] = float(values[2])
-        except Exception:
-            # GPU 정보를 사용할 수 없음
-            pass
+                    gpu_info['available'] = True
+            except ValueError:
+                # "[N/A]" 등 숫자가 아닌 출력
+                pass
 
         return gpu_info
 
-    def collect_snapshot(self) -> Dict:
-        """현재 시스템 스냅샷 수집"""
+    def _start_nvidia_smi(self) -> bool:
+        """nvidia-smi 루프 모드 프로세스를 한 번만 실행 (종료되었거나 실행할 수 없으면 False)"""
+        if self._nvsmi_proc is None:
+            if self._nvsmi_failed:
+                return False
+            try:
+                self._nvsmi_proc = subprocess.Popen(
+                    NVIDIA_SMI_COMMAND,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                    text=True,
+                    bufsize=1
+                )
+            except OSError:
+                # nvidia-smi가 설치되지 않은 시스템
+                self._nvsmi_failed = True
+                return False
+            threading.Thread(target=self._read_nvidia_smi, args=(self._nvsmi_proc,),
+                             daemon=True).start()
+        return self._nvsmi_proc.poll() is None
+
+    def _read_nvidia_smi(self, proc):
+        """nvidia-smi 출력을 계속 읽어 가장 최근 줄만 보관 (읽기 스레드)"""
+        for line in proc.stdout:
+            line = line.strip()
+            if line:
+                self._latest_gpu_line = (time.monotonic(), line)
+        proc.stdout.close()
+
+    def _init_nvml(self) -> bool:
+        """NVML을 한 번만 초기화하고 장치 핸들을 캐시 (실패하면 이후 nvidia-smi 사용)"""
+        if self._nvml_handles is not None:
+            return True
+        try:
+            pynvml.nvmlInit()
+            self._nvml_handles = [
+                pynvml.nvmlDeviceGetHandleByIndex(i)
+                for i in range(pynvml.nvmlDeviceGetCount())
+            ]
+        except pynvml.NVMLError:
+            # 드라이버/라이브러리가 없는 시스템
+            self._use_nvml = False
+            return False
+        return True
+
+    def _ttl_get(self, key: str, fn, ttl: float):
+        """캐시가 유효하면 이전 값을, 만료되었으면 fn()을 새로 호출해 반환"""
+        now = time.monotonic()
+        value, expiry = self._cache.get(key, (None, 0))
+        if now < expiry:
+            return value
+        value = fn()
+        self._cache[key] = (value, now + ttl)
+        return value
+
+    def _ttl_submit(self, key: str, fn, ttl: float) -> Future:
+        """_ttl_get의 비동기 버전 (캐시가 유효하면 스레드 풀을 거치지 않고 완료된 Future 반환)"""
+        value, expiry = self._cache.get(key, (None, 0))
+        if time.monotonic() < expiry:
+            future = Future()
+            future.set_result(value)
+            return future
+        return self._pool.submit(self._ttl_get, key, fn, ttl)
+
+    def collect_snapshot(self, sections: frozenset = SECTIONS) -> Dict:
+        """현재 시스템 스냅샷 수집 (GPU, 온도, 디스크는 TTL 동안 이전 값 재사용)"""
+        # sections에 없는 항목은 수집하지 않고 스냅샷에서 빠지며, 히스토리에는 0으로 기록됨
+        unknown = set(sections) - SECTIONS
+        if unknown:
+            raise ValueError(f"알 수 없는 수집 항목: {', '.join(sorted(unknown))}")
+        generation = self._generation
+        timestamp_ns = time.time_ns()
+        # 디스크/네트워크 속도 계산에 함께 쓰는 단조 시각 (NTP 보정의 영향을 받지 않음)
+        now = time.monotonic()
+        # 느린 GPU/온도 수집을 먼저 시작하고, 나머지는 그동안 현재 스레드에서 수집
+        temperature = gpu = None
+        if 'temperature' in sections:
+            temperature = self._ttl_submit('temperature', self.get_temperature_info,
+                                           self.temperature_ttl)
+        if 'gpu' in sections:
+            gpu = self._ttl_submit('gpu', self.get_gpu_info, self.gpu_ttl)
+
         snapshot = {
-            'timestamp': datetime.now(),
-            'elapsed_time': time.time() - self.start_time,
-            'cpu': self.get_cpu_info(),
-            'memory': self.get_memory_info(),
-            'disk': self.get_disk_info(),
-            'network': self.get_network_info(),
-            'temperature': self.get_temperature_info(),
-            'gpu': self.get_gpu_info()
+            'timestamp_ns': timestamp_ns,
+            'elapsed_time': now - self.start_time,
         }
-
-        # 히스토리에 추가
-        self.history['timestamps'].append(snapshot['timestamp'])
-        self.history['cpu_percent'].append(snapshot['cpu']['percent'])
-        self.history['memory_percent'].append(snapshot['memory']['percent'])
-        self.history['disk_read'].append(snapshot['disk']['read_speed'])
-        self.history['disk_write'].append(snapshot['disk']['write_speed'])
-        self.history['net_sent'].append(snapshot['network']['sent_speed'])
-        self.history['net_recv'].append(snapshot['network']['recv_speed'])
-
-        # 온도 정보 (평균값 저장)
-        temps = snapshot['temperature']
-        avg_temp = 0
-        temp_count = 0
-        if temps and 'error' not in temps:
-            for name, values in temps.items():
-                if isinstance(values, list):
-                    avg_temp += sum(values)
-                    temp_count += len(values)
-        if temp_count > 0:
-            avg_temp /= temp_count
-        self.history['temperatures'].append(avg_temp)
-
-        # GPU 사용률
-        self.history['gpu_usage'].append(snapshot['gpu']['usage'])
+        if 'cpu' in sections:
+            snapshot['cpu'] = self.get_cpu_info()
+        if 'memory' in sections:
+            snapshot['memory'] = self.get_memory_info()
+        if 'disk' in sections:
+            snapshot['disk'] = self._ttl_get('disk', lambda: self.get_disk_info(now), self.disk_ttl)
+        if 'network' in sections:
+            snapshot['network'] = self.get_network_info(now)
+        if temperature is not None:
+            snapshot['temperature'] = temperature.result()
+        if gpu is not None:
+            snapshot['gpu'] = gpu.result()
+
+        # 온도 정보 (모든 센서 값을 한 번에 평균, 값이 없으면 None으로 두고 UI도 이 값을 사용)
+        temps = snapshot.get('temperature', {})
+        values = []
+        if 'error' not in temps:
+            values = [v for entries in temps.values() for v in entries]
+        avg_temp = math.fsum(values) / len(values) if values else None
+        snapshot['temperature_avg'] = avg_temp
+
+        # 히스토리에 추가 (clear_history/get_history와 겹치지 않도록 잠금 안에서 기록)
+        with self._lock:
+            if generation != self._generation:
+                # 수집 도중 clear_history가 호출됨: 초기화 이전 구간의 값이므로 버림
+                return snapshot
+            self._append_history(snapshot, timestamp_ns, avg_temp)
 
         return snapshot
 
+    def _append_history(self, snapshot: Dict, timestamp_ns: int, avg_temp: Optional[float]):
+        """스냅샷을 링 버퍼의 _head 위치에 기록 (self._lock을 잡은 상태에서 호출)"""
+        # 링 버퍼 칸에 이전 값이 남아 있으므로 수집하지 않은 항목도 0으로 덮어씀
+        i = self._head
+        history = self._history
+        history['timestamps'][i] = timestamp_ns
+        cpu = snapshot.get('cpu')
+        history['cpu_percent'][i] = cpu['percent'] if cpu else 0.0
+        memory = snapshot.get('memory')
+        history['memory_percent'][i] = memory['percent'] if memory else 0.0
+        disk = snapshot.get('disk')
+        history['disk_read_mb'][i] = disk['read_speed'] * INV_MB if disk else 0.0
+        history['disk_write_mb'][i] = disk['write_speed'] * INV_MB if disk else 0.0
+        network = snapshot.get('network')
+        history['net_sent_mb'][i] = network['sent_speed'] * INV_MB if network else 0.0
+        history['net_recv_mb'][i] = network['recv_speed'] * INV_MB if network else 0.0
+        history['temperatures'][i] = avg_temp or 0.0
+        gpu = snapshot.get('gpu')
+        history['gpu_usage'][i] = gpu['usage'] if gpu else 0.0
+        self._head = (i + 1) % self.history_size
+        self._count = min(self._count + 1, self.history_size)
+
     def get_history(self) -> Dict:
-        """수집된 히스토리 반환"""
-        return self.history
+        """수집된 히스토리 반환 (항목별 NumPy 배열, 오래된 샘플부터, timestamps는 ns 정수)"""
+        with self._lock:
+            count = self._count
+            if count < self.history_size:
+                # 아직 한 바퀴 돌지 않았으면 복사 없이 앞부분 뷰 반환
+                return {key: arr[:count] for key, arr in self._history.items()}
+            head = self._head
+            return {key: np.concatenate((arr[head:], arr[:head]))
+                    for key, arr in self._history.items()}
+
+    def history_bytes(self, key: str) -> bytes:
+        """한 항목의 히스토리를 원시 바이트로 반환 (오래된 샘플부터, 직렬화/전송용)"""
+        # timestamps는 int64, 나머지는 float32 -> np.frombuffer(data, dtype=...)로 복원
+        arr = self._history[key]
+        with self._lock:
+            count = self._count
+            if count < self.history_size:
+                return arr[:count].tobytes()
+            head = self._head
+            return arr[head:].tobytes() + arr[:head].tobytes()
 
     def clear_history(self):
-        """히스토리 초기화"""
-        for key in self.history:
-            self.history[key] = []
-        self.start_time = time.time()
+        """히스토리 초기화 (버퍼는 재사용, 색인만 되돌리므로 할당/채우기 없음)"""
+        with self._lock:
+            self._head = 0
+            self._count = 0
+            self._generation += 1
+            self.start_time = time.monotonic()
+
+    def close(self):
+        """nvidia-smi 프로세스, 스레드 풀, /proc 파일 정리 (이후 수집 불가)"""
+        if self._nvsmi_proc is not None:
+            self._nvsmi_proc.terminate()
+            try:
+                self._nvsmi_proc.wait(timeout=2)
+            except subprocess.TimeoutExpired:
+                self._nvsmi_proc.kill()
+        self._pool.shutdown(wait=False)
+        if self._proc:
+            for proc_file in self._proc.values():
+                proc_file.close()
+            self._proc = None
 
 
 def format_bytes(bytes_value: float) -> str:
-    """바이트를 읽기 쉬운 형식으로 변환"""
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if bytes_value < 1024.0:
-            return f"{bytes_value:.2f} {unit}"
-        bytes_value /= 1024.0
-    return f"{bytes_value:.2f} PB"
+    """바이트를 읽기 쉬운 형식으로 변환 (바이트 단위 정수로 내림 후 캐시 조회)"""
+    return _format_bytes_int(int(bytes_value))
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_bytes_int(bytes_value: int) -> str:
+    """정수 바이트 값 변환 (총 용량처럼 반복되는 값은 캐시에서 바로 반환)"""
+    if bytes_value <= 0:
+        # 카운터 리셋 등으로 생기는 음수도 바이트 단위로 그대로 표시
+        return f"{bytes_value:.2f} B"
+    # 1024 = 2**10 이므로 비트 길이로 단위를 바로 구함 (PB 이상은 PB로 표시)
+    n = min((bytes_value.bit_length() - 1) // 10, len(BYTE_UNITS) - 1)
+    return f"{bytes_value / (1 << (10 * n)):.2f} {BYTE_UNITS[n]}"
+
+
+def ns_to_datetime(timestamp_ns: int) -> datetime:
+    """time.time_ns() 값을 표시용 datetime으로 변환 (필요한 시점에만 호출)"""
+    return datetime.fromtimestamp(timestamp_ns / 1e9)
+
+
+def decimate(times, *series, target: int = PLOT_POINTS):
+    """그래프용 균등 간격 다운샘플링 (최대 target개 점만 남김)"""
+    n = len(times)
+    if n <= target:
+        return (times,) + series
+    # 마지막 점(가장 최근 샘플)은 항상 포함: 앞쪽 target-1개 구간 + 끝점
+    step = -(-(n - 1) // (target - 1))  # ceil((n - 1) / (target - 1))
+    indices = np.append(np.arange(0, n - 1, step), n - 1)
+    return tuple(np.asarray(values)[indices] for values in (times,) + series)